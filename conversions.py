@@ -1,11 +1,22 @@
 # Simple CWOP weather API and sender
 # Copyright (C) 2023  Marco Trevisan
 
+import math
+
 from enum import Enum
 
 from typing import Optional, Union
 
 
+_KPH_TO_MPH = 1.0 / 1.609344
+_MS_TO_MPH = 3.6 / 1.609344
+_MM_TO_INCH = 1.0 / 25.4
+_MM_TO_CENTI_INCH = 100.0 / 25.4
+
+_POW10 = tuple(10**i for i in range(19))
+_POW10_SIZE = len(_POW10)
+
+
 class ConversionException(Exception):
     pass
 
@@ -17,7 +28,7 @@ def celsius_to_fahrenheit(c: Union[int, float]) -> float:
 
 def kph_to_mph(kph: Union[int, float]) -> float:
     """Converts km/h to mph"""
-    return kph / 1.609344
+    return kph * _KPH_TO_MPH
 
 
 def ms_to_kph(m: Union[int, float]) -> float:
@@ -25,6 +36,11 @@ def ms_to_kph(m: Union[int, float]) -> float:
     return m * 3.6
 
 
+def ms_to_mph(m: Union[int, float]) -> float:
+    """Converts m/s to mph"""
+    return m * _MS_TO_MPH
+
+
 def meters_to_feet(meters: Union[int, float]) -> float:
     """Converts meters to feet"""
     return meters * 3.28084
@@ -32,7 +48,12 @@ def meters_to_feet(meters: Union[int, float]) -> float:
 
 def mm_to_inch(mm: Union[int, float]) -> float:
     """Converts millimeters to inches"""
-    return mm / 25.4
+    return mm * _MM_TO_INCH
+
+
+def mm_to_centi_inch(mm: Union[int, float]) -> float:
+    """Converts millimeters to hundredths of an inch"""
+    return mm * _MM_TO_CENTI_INCH
 
 
 def lux_to_wm2(lux: Union[int, float]) -> float:
@@ -45,22 +66,25 @@ class Coordinate(Enum):
     LONGITUDE = 2
 
 
+_LORAN = {
+    Coordinate.LATITUDE: ("N", "S", 2),
+    Coordinate.LONGITUDE: ("E", "W", 3),
+}
+
+
 def coordinates_loran(type, coord) -> str:
     """Converts decimal coordinates to LORAN format"""
-    if type not in (Coordinate.LATITUDE, Coordinate.LONGITUDE):
+    try:
+        positive, negative, degrees_width = _LORAN[type]
+    except (KeyError, TypeError):
         raise ConversionException(f"Invalid coordinate type {type}")
 
-    decimals = abs(coord) % 1
-    degrees = abs(int(coord))
-    minutes = f"{decimals * 60:.2f}"
+    decimals, degrees = math.modf(abs(coord))
 
-    if type == Coordinate.LATITUDE:
-        direction = "N" if coord > 0 else "S"
-    elif type == Coordinate.LONGITUDE:
-        direction = "E" if coord > 0 else "W"
-        degrees = f"{degrees:03d}"
-
-    return f"{degrees}{minutes}{direction}"
+    return (
+        f"{int(degrees):0{degrees_width}d}{decimals * 60.0:05.2f}"
+        f"{positive if coord > 0 else negative}"
+    )
 
 
 def latitude_loran(coord: float) -> str:
@@ -90,10 +114,13 @@ def number_to_max_length_int(
     if input < 0:
         if not negative:
             return None
-    if max_length > 0:
-        if input < 0:
-            max_length -= 1
-
-        if abs(input) >= pow(10, max_length):
+        max_length -= 1
+        if max_length >= 0 and -input >= (
+            _POW10[max_length] if max_length < _POW10_SIZE else 10**max_length
+        ):
             return None
+    elif max_length > 0 and input >= (
+        _POW10[max_length] if max_length < _POW10_SIZE else 10**max_length
+    ):
+        return None
     return input
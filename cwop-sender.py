@@ -151,10 +151,11 @@ if __name__ == "__main__":
         comment=args.comment,
     )
 
-    logger.debug(f"Report prepared as {report}")
+    logger.debug("Report prepared as %s", report)
 
     if args.dry_run:
-        logger.debug(f"Dry run: CWOP packet '{report.to_cwop_packet()}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dry run: CWOP packet '%s'", report.to_cwop_packet())
         sys.exit(0)
 
     cwop.send_report(report)
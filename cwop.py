@@ -5,7 +5,7 @@
 #  ftp://ftp.tapr.org/aprssig/aprsspec/spec/aprs101/APRS101.pdf
 #  http://www.aprs.org/aprs11/spec-wx.txt
 
-from typing import Callable, NamedTuple, Optional, Union
+from typing import Callable, Iterable, NamedTuple, Optional, Union
 
 import conversions
 import datetime
@@ -14,26 +14,62 @@ import socket
 
 logger = logging.getLogger(__name__)
 
+_UTC = datetime.timezone.utc
+_COMMENT_TABLE = str.maketrans({"~": "-", "|": "/"})
+
+
+def _conv_humidity(h: float) -> int:
+    return int(h) % 100
+
+
+def _conv_pressure(p: float) -> int:
+    return int(p) // 10
+
 
 class CWOPValue(object):
+    __slots__ = ("__dict__", "value", "_converted", "_int_value")
+
+    prefix: str = ""
+    _max_digits: int = -1
+    _converter: Optional[Callable] = None
+    _negative: bool = False
+    _use_float: bool = False
+
     def __init__(
         self,
         value: Union[int, float, None],
-        converter: Callable = None,
-        max_digits: int = -1,
-        negative: bool = False,
-        use_float: bool = False,
-        prefix: str = "",
+        converter: Optional[Callable] = None,
+        max_digits: Optional[int] = None,
+        negative: Optional[bool] = None,
+        use_float: Optional[bool] = None,
+        prefix: Optional[str] = None,
     ):
-        super().__init__()
         self.value = value
-        self._max_digits = max_digits
-        self._converted = converter(value) if converter and value is not None else value
+
+        if converter is not None:
+            self._converter = converter
+        if max_digits is not None:
+            self._max_digits = max_digits
+        if negative is not None:
+            self._negative = negative
+        if use_float is not None:
+            self._use_float = use_float
+        if prefix is not None:
+            self.prefix = prefix if len(prefix) == 1 else ""
+
+        if value is None:
+            self._converted = None
+            self._int_value = None
+            return
+
+        converter = self._converter
+        max_digits = self._max_digits
+        self._converted = converter(value) if converter else value
         self._int_value = conversions.number_to_max_length_int(
-            self._converted, self._max_digits, negative=negative
+            self._converted, max_digits, negative=self._negative
         )
         if (
-            use_float
+            self._use_float
             and self._converted
             and (
                 self._int_value
@@ -44,8 +80,6 @@ class CWOPValue(object):
             cut = str(self._converted)[:max_digits]
             self._int_value = float(cut) if "." in cut else int(cut)
 
-        self.prefix = prefix if prefix and len(prefix) == 1 else ""
-
     def __bool__(self):
         return self._int_value is not None
 
@@ -75,6 +109,50 @@ class CWOPValue(object):
         return f"{self.prefix}{self._int_value:>0{self._max_digits}}"
 
 
+def _cwop_value_type(
+    name: str,
+    prefix: str,
+    max_digits: int,
+    converter: Optional[Callable] = None,
+    negative: bool = False,
+    use_float: bool = False,
+) -> type:
+    return type(
+        name,
+        (CWOPValue,),
+        {
+            "__slots__": (),
+            "prefix": prefix,
+            "_max_digits": max_digits,
+            "_converter": staticmethod(converter) if converter else None,
+            "_negative": negative,
+            "_use_float": use_float,
+        },
+    )
+
+
+TemperatureValue = _cwop_value_type(
+    "TemperatureValue",
+    "t",
+    3,
+    conversions.celsius_to_fahrenheit,
+    negative=True,
+)
+HumidityValue = _cwop_value_type("HumidityValue", "h", 2, _conv_humidity)
+PressureValue = _cwop_value_type("PressureValue", "b", 5, _conv_pressure)
+WindValue = _cwop_value_type("WindValue", "/", 3, conversions.ms_to_mph)
+WindDirectionValue = _cwop_value_type("WindDirectionValue", "_", 3)
+WindGustValue = _cwop_value_type("WindGustValue", "g", 3, conversions.ms_to_mph)
+Rain1hValue = _cwop_value_type("Rain1hValue", "r", 3, conversions.mm_to_centi_inch)
+Rain24hValue = _cwop_value_type("Rain24hValue", "p", 3, conversions.mm_to_centi_inch)
+RainDayValue = _cwop_value_type("RainDayValue", "P", 3, conversions.mm_to_centi_inch)
+Snow24hValue = _cwop_value_type(
+    "Snow24hValue", "s", 3, conversions.mm_to_inch, use_float=True
+)
+IlluminanceValue = _cwop_value_type("IlluminanceValue", "L", 3)
+HighIlluminanceValue = _cwop_value_type("HighIlluminanceValue", "l", 3)
+
+
 class CWOPReport(NamedTuple):
     designator: str
     timestamp: Optional[datetime.datetime]
@@ -97,27 +175,11 @@ class CWOPReport(NamedTuple):
     def to_cwop_packet(self):
         use_aprs_messaging = True
 
-        packet = f"{self.designator:s}>APRS,TCPIP*:"
-
         if self.timestamp:
-            packet += f"{'@' if use_aprs_messaging else '/':s}"
-            packet += f"{self.timestamp:%d%H%M}z"
+            timestamp = "@" if use_aprs_messaging else "/"
+            timestamp += f"{self.timestamp:%d%H%M}z"
         else:
-            packet += f"{'=' if use_aprs_messaging else '!':s}"
-
-        packet += f"{self.latitude}/{self.longitude}"
-        packet += f"{self.wind_dir}{self.wind}{self.wind_gust}{self.temperature}"
-
-        if self.rain_1h:
-            packet += str(self.rain_1h)
-
-        packet += f"{self.rain_24h}{self.rain_day}{self.humidity}{self.pressure}"
-
-        if self.illuminance:
-            packet += str(self.illuminance)
-
-        if self.snow_24h:
-            packet += str(self.snow_24h)
+            timestamp = "=" if use_aprs_messaging else "!"
 
         comment_data = []
 
@@ -129,9 +191,48 @@ class CWOPReport(NamedTuple):
 
         comment_data.append("- cwop-sender.py")
 
-        packet += " ".join(comment_data)
+        return (
+            f"{self.designator:s}>APRS,TCPIP*:{timestamp}"
+            f"{self.latitude}/{self.longitude}"
+            f"{self.wind_dir}{self.wind}{self.wind_gust}{self.temperature}"
+            f"{self.rain_1h if self.rain_1h else ''}"
+            f"{self.rain_24h}{self.rain_day}{self.humidity}{self.pressure}"
+            f"{self.illuminance if self.illuminance else ''}"
+            f"{self.snow_24h if self.snow_24h else ''}"
+            f"{' '.join(comment_data)}"
+        )
 
-        return packet
+
+class CWOPSession:
+    def __init__(self, cwop: "CWOP"):
+        self._cwop = cwop
+        self._sock = None
+
+    def __enter__(self) -> "CWOPSession":
+        self._sock = self._cwop._login_socket()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self._sock.shutdown(socket.SHUT_RDWR)
+        finally:
+            self._sock.close()
+            self._sock = None
+
+    def send_report(self, report: CWOPReport):
+        if not isinstance(report, CWOPReport):
+            raise Exception("Not a valid CWOPReport instance")
+
+        packet = report.to_cwop_packet()
+        logger.debug(
+            "Sending CWOP packet '%s' to %s:%s",
+            packet,
+            self._cwop._server,
+            self._cwop._port,
+        )
+
+        self._sock.sendall(f"{packet}\n".encode("ASCII"))
 
 
 class CWOP:
@@ -152,13 +253,16 @@ class CWOP:
         self._longitude = conversions.longitude_loran(longitude)
         self._altitude = conversions.meters_to_feet(altitude) if altitude else None
         self._passcode = passcode
+        self._login = (
+            f"user {designator} pass {passcode or -1} vers cwop-sender.py 0.5\n"
+        ).encode("ASCII")
 
         if not self._server:
             self._server = "rotate.aprs.net" if self._passcode else "cwop.aprs.net"
 
     def prepare_report(
         self,
-        timestamp=Optional[datetime.datetime],
+        timestamp: Optional[datetime.datetime] = None,
         wind: Optional[float] = None,
         wind_dir: Optional[int] = None,
         gust: Optional[float] = None,
@@ -173,16 +277,11 @@ class CWOP:
         comment: Optional[str] = None,
     ) -> CWOPReport:
         timestamp = (
-            timestamp.astimezone(datetime.timezone.utc)
-            if timestamp
-            else datetime.datetime.utcnow()
+            timestamp.astimezone(_UTC) if timestamp else datetime.datetime.now(_UTC)
         )
 
         if comment:
-            if "~" in comment:
-                comment = comment.replace("~", "-")
-            if "|" in comment:
-                comment = comment.replace("|", "/")
+            comment = comment.translate(_COMMENT_TABLE)
 
         return CWOPReport(
             designator=self._designator,
@@ -190,64 +289,20 @@ class CWOP:
             latitude=self._latitude,
             longitude=self._longitude,
             altitude=self._altitude,
-            temperature=CWOPValue(
-                temperature,
-                conversions.celsius_to_fahrenheit,
-                prefix="t",
-                max_digits=3,
-                negative=True,
-            ),
-            humidity=CWOPValue(
-                humidity, lambda h: int(h % 100), prefix="h", max_digits=2
-            ),
-            pressure=CWOPValue(
-                pressure,
-                lambda p: conversions.number_to_max_length_int(p / 10.0),
-                prefix="b",
-                max_digits=5,
-            ),
-            wind=CWOPValue(
-                wind,
-                lambda w: conversions.kph_to_mph(conversions.ms_to_kph(w)),
-                prefix="/",
-                max_digits=3,
-            ),
-            wind_dir=CWOPValue(wind_dir, max_digits=3, prefix="_"),
-            wind_gust=CWOPValue(
-                gust,
-                lambda w: conversions.kph_to_mph(conversions.ms_to_kph(w)),
-                prefix="g",
-                max_digits=3,
-            ),
-            rain_1h=CWOPValue(
-                rain_1h,
-                lambda r: 100 * conversions.mm_to_inch(r),
-                prefix="r",
-                max_digits=3,
-            ),
-            rain_24h=CWOPValue(
-                rain_24h,
-                lambda r: 100 * conversions.mm_to_inch(r),
-                prefix="p",
-                max_digits=3,
-            ),
-            rain_day=CWOPValue(
-                rain_day,
-                lambda r: 100 * conversions.mm_to_inch(r),
-                prefix="P",
-                max_digits=3,
-            ),
-            snow_24h=CWOPValue(
-                snow_24h,
-                lambda r: conversions.mm_to_inch(r),
-                prefix="s",
-                max_digits=3,
-                use_float=True,
-            ),
-            illuminance=CWOPValue(
-                illuminance if illuminance < 1000 else illuminance - 1000,
-                prefix="L" if illuminance < 1000 else "l",
-                max_digits=3,
+            temperature=TemperatureValue(temperature),
+            humidity=HumidityValue(humidity),
+            pressure=PressureValue(pressure),
+            wind=WindValue(wind),
+            wind_dir=WindDirectionValue(wind_dir),
+            wind_gust=WindGustValue(gust),
+            rain_1h=Rain1hValue(rain_1h),
+            rain_24h=Rain24hValue(rain_24h),
+            rain_day=RainDayValue(rain_day),
+            snow_24h=Snow24hValue(snow_24h),
+            illuminance=(
+                IlluminanceValue(illuminance)
+                if illuminance < 1000
+                else HighIlluminanceValue(illuminance - 1000)
             )
             if illuminance
             else None,
@@ -255,11 +310,11 @@ class CWOP:
         )
 
     def _open_socket(self):
+        logger.debug("Connecting to %s:%s", self._server, self._port)
+        sock = socket.create_connection((self._server, self._port), timeout=5)
+
         try:
-            sock = socket.socket()
-            sock.settimeout(5)
-            logger.debug(f"Connecting to {self._server}:{self._port}")
-            sock.connect((self._server, self._port))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock.settimeout(30)
 
         except Exception:
@@ -268,31 +323,43 @@ class CWOP:
 
         return sock
 
+    def _login_socket(self):
+        sock = self._open_socket()
+
+        try:
+            response = bytearray(4096)
+            size = sock.recv_into(response)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "server software: %s", response[:size].decode("ASCII").strip()
+                )
+
+            logger.debug('login: "%s"', self._login)
+
+            sock.sendall(self._login)
+            size = sock.recv_into(response)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "server login ack: %s", response[:size].decode("ASCII").strip()
+                )
+
+        except Exception:
+            sock.close()
+            raise
+
+        return sock
+
+    def open_session(self) -> CWOPSession:
+        return CWOPSession(self)
+
     def send_report(self, report):
         if not isinstance(report, CWOPReport):
             raise Exception("Not a valid CWOPReport instance")
 
-        try:
-            sock = self._open_socket()
-            response = sock.recv(4096).decode("ASCII")
-            logger.debug("server software: %s", response.strip())
-
-            passcode = self._passcode or -1
-            login = f"user {self._designator} pass {passcode} vers cwop-sender.py 0.5\n"
-            login = login.encode("ASCII")
-            logger.debug(f'login: "{login}"')
-
-            sock.sendall(login)
-            response = sock.recv(4096).decode("ASCII")
-            logger.debug("server login ack: %s", response.strip())
-
-            packet = report.to_cwop_packet()
-            logger.debug(
-                f"Sending CWOP packet '{packet}' to {self._server}:{self._port}"
-            )
-
-            sock.sendall(packet.encode("ASCII") + b"\n")
-            sock.shutdown(socket.SHUT_RDWR)
+        with self.open_session() as session:
+            session.send_report(report)
 
-        finally:
-            sock.close()
+    def send_reports(self, reports: Iterable[CWOPReport]):
+        with self.open_session() as session:
+            for report in reports:
+                session.send_report(report)